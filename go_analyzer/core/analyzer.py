@@ -6,10 +6,16 @@ syntactic, and semantic analysis on Go source code. It orchestrates calls
 to both the lexer and parser GUI functions.
 """
 
+import re
+
 from .lexer.go_lexer import run_lexer_gui
 from .parser.go_parser import run_parser_gui
 
 
+# Error totals reported in the parser output summary
+_ERROR_TOTAL_RE = re.compile(r"^Total (Syntax|Semantic) Errors:\s*(\d+)\s*$", re.MULTILINE)
+
+
 def analyze_code(source_code: str) -> dict:
     """
     Perform complete analysis on Go source code.
@@ -71,15 +77,8 @@ def analyze_code(source_code: str) -> dict:
                 f"{'=' * 70}"
             )
 
-        # Check if there were any errors
-        if (
-            "Error" in result["lexical_analysis"]
-            or "Error" in result["parser_analysis"]
-        ):
-            # Don't mark as error status unless analysis completely failed
-            # This allows partial results to be displayed
-            pass
-
+        # Errors in the outputs don't change the status; only a complete
+        # failure does. This allows partial results to be displayed
         return result
 
     except Exception as e:
@@ -168,32 +167,24 @@ def analyze_code_detailed(source_code: str) -> dict:
             result["syntax_analysis"]["output"] = parser_output
 
             # Extract error information from parser output
-            if "✗ Syntax Errors Found:" in parser_output:
+            has_syntax_errors = "✗ Syntax Errors Found:" in parser_output
+            has_semantic_errors = "✗ Semantic Errors Found:" in parser_output
+
+            if has_syntax_errors:
                 result["syntax_analysis"]["has_syntax_errors"] = True
                 result["summary"]["error_types"].append("syntax")
 
-                # Try to extract error count
-                for line in parser_output.split("\n"):
-                    if "Total Syntax Errors:" in line:
-                        try:
-                            count = int(line.split(":")[-1].strip())
-                            result["summary"]["total_errors"] += count
-                        except:
-                            pass
-
-            if "✗ Semantic Errors Found:" in parser_output:
+            if has_semantic_errors:
                 result["syntax_analysis"]["has_semantic_errors"] = True
                 if "semantic" not in result["summary"]["error_types"]:
                     result["summary"]["error_types"].append("semantic")
 
-                # Try to extract error count
-                for line in parser_output.split("\n"):
-                    if "Total Semantic Errors:" in line:
-                        try:
-                            count = int(line.split(":")[-1].strip())
-                            result["summary"]["total_errors"] += count
-                        except:
-                            pass
+            # Extract error counts from the summary in a single scan
+            if has_syntax_errors or has_semantic_errors:
+                counted = {"Syntax": has_syntax_errors, "Semantic": has_semantic_errors}
+                for match in _ERROR_TOTAL_RE.finditer(parser_output):
+                    if counted[match.group(1)]:
+                        result["summary"]["total_errors"] += int(match.group(2))
 
         except Exception as parser_error:
             result["syntax_analysis"]["output"] = (
@@ -5,6 +5,12 @@ Provides a graphical user interface for analyzing Go code with
 lexical, syntax, and semantic analysis.
 """
 
-from .main_window import MainWindow
-
 __all__ = ['MainWindow']
+
+
+def __getattr__(name):
+    """Import MainWindow on first access so subpackages load without Tk widgets."""
+    if name == 'MainWindow':
+        from .main_window import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -48,8 +48,8 @@ class CodeEditor(tk.Frame):
         # Configure tab handling
         self._setup_tab_handling()
 
-        # Insert welcome message
-        self._insert_welcome_message()
+        # Insert welcome message once the window has been set up
+        self.after_idle(self._insert_welcome_message)
 
     def _setup_tab_handling(self):
         """Configure tab key to insert spaces instead of tab character."""
@@ -30,6 +30,10 @@ class ControlPanel(tk.Frame):
         # Store callbacks
         self.callbacks = callbacks or {}
 
+        # Last applied status and button state, used to skip redundant updates
+        self._status = (STATUS_READY, "normal")
+        self._buttons_enabled = True
+
         # Set up the control panel UI
         self._setup_ui()
 
@@ -116,8 +120,12 @@ class ControlPanel(tk.Frame):
             message (str): Status message to display
             status_type (str): Type of status - "normal", "running", "success", "error"
         """
+        if (message, status_type) == self._status:
+            return
+
         color = get_status_color(status_type)
         self.status_label.config(text=message, foreground=color)
+        self._status = (message, status_type)
 
     def enable_buttons(self, enabled=True):
         """
@@ -126,11 +134,16 @@ class ControlPanel(tk.Frame):
         Args:
             enabled (bool): True to enable, False to disable
         """
+        enabled = bool(enabled)
+        if enabled == self._buttons_enabled:
+            return
+
         state = tk.NORMAL if enabled else tk.DISABLED
         self.run_button.config(state=state)
         self.clear_button.config(state=state)
         self.load_button.config(state=state)
         self.save_button.config(state=state)
+        self._buttons_enabled = enabled
 
     def set_callback(self, action, callback):
         """
@@ -43,8 +43,8 @@ class ResultsPanel(tk.Frame):
         # Configure text tags for formatting
         self._setup_text_tags()
 
-        # Display welcome message
-        self._display_welcome_message()
+        # Display welcome message once the window has been set up
+        self.after_idle(self._display_welcome_message)
 
     def _setup_text_tags(self):
         """Configure text tags for color-coded output."""
@@ -91,8 +91,30 @@ class ResultsPanel(tk.Frame):
             message (str): Message to display
             tag (str): Text tag for formatting (default: "info")
         """
-        self.clear()
-        self._append_text(message, tag)
+        # Replace the contents with the welcome message and the new message
+        # in one edit instead of a clear followed by a separate append
+        self.text_widget.config(state=tk.NORMAL)
+        self.text_widget.delete("1.0", tk.END)
+        self.text_widget.insert(tk.END, DEFAULT_WELCOME_MESSAGE, "info", message, tag or "")
+        self.text_widget.config(state=tk.DISABLED)
+        self._auto_scroll()
+
+    def _append_runs(self, runs):
+        """
+        Append several pieces of text to the results panel in one insert.
+
+        Args:
+            runs (list): List of (text, tag) tuples; tag may be None
+        """
+        args = []
+        for text, tag in runs:
+            args.append(text)
+            args.append(tag or "")
+
+        self.text_widget.config(state=tk.NORMAL)
+        self.text_widget.insert(tk.END, *args)
+        self.text_widget.config(state=tk.DISABLED)
+        self._auto_scroll()
 
     def display_results(self, results_dict):
         """
@@ -105,38 +127,41 @@ class ResultsPanel(tk.Frame):
         self.clear()
 
         # Header
-        self._append_text("=" * 60 + "\n", "header")
-        self._append_text("  GO CODE ANALYSIS RESULTS\n", "header")
-        self._append_text("=" * 60 + "\n\n", "header")
+        runs = [
+            ("=" * 60 + "\n", "header"),
+            ("  GO CODE ANALYSIS RESULTS\n", "header"),
+            ("=" * 60 + "\n\n", "header"),
+        ]
 
         # Lexer output
         if "lexer_output" in results_dict:
-            self._append_text("LEXICAL ANALYSIS\n", "section")
-            self._append_text("-" * 60 + "\n", "section")
-            self._append_text(results_dict["lexer_output"] + "\n\n")
+            runs.append(("LEXICAL ANALYSIS\n", "section"))
+            runs.append(("-" * 60 + "\n", "section"))
+            runs.append((results_dict["lexer_output"] + "\n\n", None))
 
         # Parser output
         if "parser_output" in results_dict:
-            self._append_text("SYNTAX & SEMANTIC ANALYSIS\n", "section")
-            self._append_text("-" * 60 + "\n", "section")
-            self._append_text(results_dict["parser_output"] + "\n\n")
+            runs.append(("SYNTAX & SEMANTIC ANALYSIS\n", "section"))
+            runs.append(("-" * 60 + "\n", "section"))
+            runs.append((results_dict["parser_output"] + "\n\n", None))
 
         # Errors summary
         if "errors" in results_dict and results_dict["errors"]:
-            self._append_text("ERRORS DETECTED\n", "error")
-            self._append_text("-" * 60 + "\n", "error")
-            for error in results_dict["errors"]:
-                self._append_text(f"  {error}\n", "error")
-            self._append_text("\n")
+            runs.append(("ERRORS DETECTED\n", "error"))
+            runs.append(("-" * 60 + "\n", "error"))
+            runs.extend((f"  {error}\n", "error") for error in results_dict["errors"])
+            runs.append(("\n", None))
 
         # Success indicator
         if "success" in results_dict:
             if results_dict["success"]:
-                self._append_text("\nAnalysis completed successfully!\n", "success")
+                runs.append(("\nAnalysis completed successfully!\n", "success"))
             else:
-                self._append_text("\nAnalysis completed with errors.\n", "error")
+                runs.append(("\nAnalysis completed with errors.\n", "error"))
+
+        runs.append(("\n" + "=" * 60 + "\n", "header"))
 
-        self._append_text("\n" + "=" * 60 + "\n", "header")
+        self._append_runs(runs)
 
     def display_error(self, error_message):
         """
@@ -146,9 +171,25 @@ class ResultsPanel(tk.Frame):
             error_message (str): Error message to display
         """
         self.clear()
-        self._append_text("ERROR\n", "error")
-        self._append_text("-" * 60 + "\n", "error")
-        self._append_text(error_message + "\n", "error")
+        self._append_runs([
+            ("ERROR\n", "error"),
+            ("-" * 60 + "\n", "error"),
+            (error_message + "\n", "error"),
+        ])
+
+    def iter_text(self, chunk_lines=1000):
+        """
+        Iterate over the results panel text in chunks of lines.
+
+        Args:
+            chunk_lines (int): Number of lines per chunk (default: 1000)
+
+        Yields:
+            str: Consecutive slices of the results text content
+        """
+        last_line = int(self.text_widget.index("end-1c").split(".")[0])
+        for start in range(1, last_line + 1, chunk_lines):
+            yield self.text_widget.get(f"{start}.0", f"{start + chunk_lines}.0")
 
     def get_text(self):
         """
@@ -157,7 +198,7 @@ class ResultsPanel(tk.Frame):
         Returns:
             str: The results text content
         """
-        return self.text_widget.get("1.0", tk.END)
+        return "".join(self.iter_text())
 
     def pack(self, **kwargs):
         """Override pack to apply to the frame."""
@@ -5,6 +5,8 @@ Centralizes all GUI constants including colors, fonts, dimensions,
 and other configuration settings.
 """
 
+from functools import lru_cache
+
 
 # ============================================================================
 # WINDOW CONFIGURATION
@@ -249,6 +251,7 @@ def get_tag_config():
     }
 
 
+@lru_cache(maxsize=16)
 def get_status_color(status_type):
     """
     Get color for status label based on type.
@@ -5,9 +5,21 @@ Coordinates between the GUI and the analyzer backend, managing the analysis
 workflow and formatting results for display.
 """
 
+import re
+
 from ...core.analyzer import analyze_code, analyze_code_detailed
 
 
+# Line classifiers used by _apply_formatted_text
+_SECTION_RE = re.compile(r"LEXICAL ANALYSIS|SYNTAX & SEMANTIC ANALYSIS|CRITICAL ERROR")
+_ERROR_RE = re.compile(r"error", re.IGNORECASE)
+
+# Markers that indicate the analyzer reported errors
+_ERROR_MARKERS_RE = re.compile(
+    r"Lexical errors detected:|✗ Syntax Errors Found:|✗ Semantic Errors Found:|Analysis Failed"
+)
+
+
 class AnalysisHandler:
     """Handles analysis orchestration between GUI and backend."""
 
@@ -24,6 +36,10 @@ class AnalysisHandler:
         self.results_panel = results_panel
         self.control_panel = control_panel
 
+        # Source and result of the last run of each analyzer function,
+        # reused when the code is unchanged
+        self._last_results = {}
+
     def handle_analysis(self):
         """
         Perform complete analysis on the current code.
@@ -36,10 +52,6 @@ class AnalysisHandler:
         5. Display in results panel
         6. Update status
         """
-        # Update status to running
-        self.control_panel.set_status("Running analysis...", "running")
-        self.control_panel.enable_buttons(False)
-
         try:
             # Get code from editor
             code = self.code_editor.get_code()
@@ -53,11 +65,12 @@ class AnalysisHandler:
                 self.control_panel.set_status("No code provided", "error")
                 return
 
-            # Clear previous results
-            self.results_panel.clear()
+            # Update status to running
+            self.control_panel.set_status("Running analysis...", "running")
+            self.control_panel.enable_buttons(False)
 
             # Perform analysis using the unified analyzer
-            result = analyze_code(code)
+            result = self._run_analyzer(analyze_code, code)
 
             # Format and display results
             self._display_analysis_results(result)
@@ -68,12 +81,9 @@ class AnalysisHandler:
                 lexical_output = result.get("lexical_analysis", "")
                 parser_output = result.get("parser_analysis", "")
 
-                has_errors = (
-                    "Lexical errors detected:" in lexical_output or
-                    "✗ Syntax Errors Found:" in parser_output or
-                    "✗ Semantic Errors Found:" in parser_output or
-                    "Analysis Failed" in lexical_output or
-                    "Analysis Failed" in parser_output
+                has_errors = bool(
+                    _ERROR_MARKERS_RE.search(lexical_output) or
+                    _ERROR_MARKERS_RE.search(parser_output)
                 )
 
                 if has_errors:
@@ -97,6 +107,29 @@ class AnalysisHandler:
             # Re-enable buttons
             self.control_panel.enable_buttons(True)
 
+    def _run_analyzer(self, analyzer, code):
+        """
+        Run an analyzer function, reusing its previous result if the code
+        has not changed since its last run.
+
+        Args:
+            analyzer (callable): analyze_code or analyze_code_detailed
+            code (str): Source code to analyze
+
+        Returns:
+            dict: Analysis result
+        """
+        last = self._last_results.get(analyzer)
+        if last is not None and last[0] == code:
+            return last[1]
+
+        # Flush pending redraws once so the running status is shown
+        # while the analyzer blocks the event loop
+        self.control_panel.update_idletasks()
+        result = analyzer(code)
+        self._last_results[analyzer] = (code, result)
+        return result
+
     def _display_analysis_results(self, result):
         """
         Format and display analysis results.
@@ -139,9 +172,8 @@ class AnalysisHandler:
 
         # Join and display
         formatted_output = "\n".join(output_lines)
-        self.results_panel.clear()
 
-        # Display with appropriate formatting
+        # Replace previous results and display with appropriate formatting
         self.results_panel.text_widget.config(state="normal")
         self.results_panel.text_widget.delete("1.0", "end")
 
@@ -155,38 +187,67 @@ class AnalysisHandler:
         """
         Apply color-coded formatting to the results text.
 
+        Consecutive lines sharing a tag are joined into a single run, and all
+        runs are handed to the text widget in one insert call.
+
         Args:
             text (str): The formatted text to display
             result (dict): Analysis result for context
         """
-        lines = text.split("\n")
-
-        for line in lines:
-            # Determine the appropriate tag based on content
-            if line.startswith("="):
-                # Header separator
-                self.results_panel.text_widget.insert("end", line + "\n", "header")
-            elif "GO CODE ANALYSIS RESULTS" in line:
-                # Main title
-                self.results_panel.text_widget.insert("end", line + "\n", "header")
-            elif line.startswith("-"):
-                # Section separator
-                self.results_panel.text_widget.insert("end", line + "\n", "section")
-            elif any(keyword in line for keyword in ["LEXICAL ANALYSIS", "SYNTAX & SEMANTIC ANALYSIS", "CRITICAL ERROR"]):
-                # Section headers
-                self.results_panel.text_widget.insert("end", line + "\n", "section")
-            elif "Error" in line or "error" in line.lower():
-                # Error lines
-                self.results_panel.text_widget.insert("end", line + "\n", "error")
-            elif "✓" in line or "Success" in line:
-                # Success indicators
-                self.results_panel.text_widget.insert("end", line + "\n", "success")
-            elif "✗" in line or "Warning" in line:
-                # Warning indicators
-                self.results_panel.text_widget.insert("end", line + "\n", "warning")
-            else:
-                # Normal text
-                self.results_panel.text_widget.insert("end", line + "\n")
+        classify = self._classify_line
+        segments = []
+        run_lines = []
+        run_tag = None
+
+        for line in text.split("\n"):
+            tag = classify(line)
+            if tag != run_tag and run_lines:
+                segments.append("\n".join(run_lines) + "\n")
+                segments.append(run_tag)
+                run_lines = []
+            run_tag = tag
+            run_lines.append(line)
+
+        if run_lines:
+            segments.append("\n".join(run_lines) + "\n")
+            segments.append(run_tag)
+
+        self.results_panel.text_widget.insert("end", *segments)
+
+    @staticmethod
+    def _classify_line(line):
+        """
+        Determine the text tag for a single line of results.
+
+        Args:
+            line (str): Line of formatted output
+
+        Returns:
+            str: Tag name, or an empty string for normal text
+        """
+        if line.startswith("="):
+            # Header separator
+            return "header"
+        elif "GO CODE ANALYSIS RESULTS" in line:
+            # Main title
+            return "header"
+        elif line.startswith("-"):
+            # Section separator
+            return "section"
+        elif _SECTION_RE.search(line):
+            # Section headers
+            return "section"
+        elif _ERROR_RE.search(line):
+            # Error lines
+            return "error"
+        elif "✓" in line or "Success" in line:
+            # Success indicators
+            return "success"
+        elif "✗" in line or "Warning" in line:
+            # Warning indicators
+            return "warning"
+        # Normal text
+        return ""
 
     def handle_detailed_analysis(self):
         """
@@ -207,7 +268,7 @@ class AnalysisHandler:
                 return
 
             # Use detailed analyzer
-            result = analyze_code_detailed(code)
+            result = self._run_analyzer(analyze_code_detailed, code)
 
             # Format detailed results
             self._display_detailed_results(result)
@@ -275,7 +336,6 @@ class AnalysisHandler:
 
         # Display
         formatted_output = "\n".join(output_lines)
-        self.results_panel.clear()
         self.results_panel.text_widget.config(state="normal")
         self.results_panel.text_widget.delete("1.0", "end")
         self._apply_formatted_text(formatted_output, result)
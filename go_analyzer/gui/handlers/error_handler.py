@@ -9,9 +9,39 @@ import re
 from typing import List, Dict, Tuple
 
 
+# Summary separators
+_SEPARATOR = "=" * 70
+_SUBSEPARATOR = "-" * 70
+
+# Line number patterns in priority order: "line 5" (which also covers
+# "at line 5" and "[Line 5]") is preferred over "Line: 5"
+_LINE_NUMBER_RES = (
+    re.compile(r'line\s+(\d+)', re.IGNORECASE),
+    re.compile(r'Line:\s*(\d+)', re.IGNORECASE),
+)
+
+# Keywords that mark a lexical output line as an error
+_LEXICAL_KEYWORD_RE = re.compile(r'error|invalid', re.IGNORECASE)
+
+# Section headers and separators in parser output, one match per line
+_PARSER_MARKER_RE = re.compile(
+    r'^(?:(?P<syntax>.*Syntax Errors Found:.*)'
+    r'|(?P<semantic>.*Semantic Errors Found:.*)'
+    r'|(?P<separator>(?:=|-{10}).*))$',
+    re.MULTILINE
+)
+
+
 class ErrorHandler:
     """Handles error parsing, formatting, and display."""
 
+    # Display prefixes by error type
+    _DISPLAY_PREFIXES = {
+        'lexical': '🔤 [LEXICAL] ',
+        'syntax': '📝 [SYNTAX] ',
+        'semantic': '🔍 [SEMANTIC] '
+    }
+
     def __init__(self):
         """Initialize the error handler."""
         self.lexical_errors = []
@@ -66,30 +96,36 @@ class ErrorHandler:
             List of lexical error messages
         """
         errors = []
+        keyword_matches = []
+        in_error_section = False
+        error_section_done = False
 
-        # Look for error indicators in lexical output
-        if "Lexical errors detected:" in output:
-            # Extract error section
-            lines = output.split('\n')
-            in_error_section = False
+        for line in output.splitlines():
+            stripped = line.strip()
 
-            for line in lines:
+            # Look for error indicators in lexical output
+            if not error_section_done:
                 if "Lexical errors detected:" in line:
                     in_error_section = True
-                    continue
                 elif in_error_section:
                     # Stop at next section or empty line series
-                    if line.startswith("=") or line.startswith("-"):
-                        break
-                    if line.strip() and not line.startswith(" " * 10):
-                        errors.append(line.strip())
-
-        # Alternative: Look for "Error" or "Invalid" in output
-        lines = output.split('\n')
-        for line in lines:
-            if 'error' in line.lower() or 'invalid' in line.lower():
-                if line.strip() and line not in errors:
-                    errors.append(line.strip())
+                    if line.startswith(("=", "-")):
+                        in_error_section = False
+                        error_section_done = True
+                    elif stripped and not line.startswith(" " * 10):
+                        errors.append(stripped)
+
+            # Alternative: Look for "Error" or "Invalid" in output
+            if stripped and _LEXICAL_KEYWORD_RE.search(line):
+                keyword_matches.append((line, stripped))
+
+        # Keyword matches come after the error section; lines already
+        # reported verbatim are skipped
+        seen = set(errors)
+        for line, stripped in keyword_matches:
+            if line not in seen:
+                errors.append(stripped)
+                seen.add(stripped)
 
         return errors
 
@@ -106,37 +142,43 @@ class ErrorHandler:
         syntax_errors = []
         semantic_errors = []
 
-        lines = output.split('\n')
-        in_syntax_section = False
-        in_semantic_section = False
-
-        for line in lines:
-            # Detect sections
-            if "Syntax Errors Found:" in line or "✗ Syntax Errors Found:" in line:
-                in_syntax_section = True
-                in_semantic_section = False
-                continue
-            elif "Semantic Errors Found:" in line or "✗ Semantic Errors Found:" in line:
-                in_semantic_section = True
-                in_syntax_section = False
-                continue
-            elif line.startswith("=") or line.startswith("-" * 10):
-                # Section separator - reset flags
-                if not ("Error" in line):
-                    in_syntax_section = False
-                    in_semantic_section = False
-                continue
-
-            # Collect errors based on current section
-            if in_syntax_section and line.strip():
-                if not line.startswith("Total") and not line.startswith("✗"):
-                    syntax_errors.append(line.strip())
-            elif in_semantic_section and line.strip():
-                if not line.startswith("Total") and not line.startswith("✗"):
-                    semantic_errors.append(line.strip())
+        # Locate section markers in one scan; only the text between them
+        # needs to be walked line by line
+        section = None
+        position = 0
+
+        for marker in _PARSER_MARKER_RE.finditer(output):
+            if section is not None:
+                self._collect_section_errors(output[position:marker.start()], section)
+            position = marker.end()
+
+            if marker.lastgroup == 'syntax':
+                section = syntax_errors
+            elif marker.lastgroup == 'semantic':
+                section = semantic_errors
+            elif not ("Error" in marker.group()):
+                # Section separator - reset section
+                section = None
+
+        if section is not None:
+            self._collect_section_errors(output[position:], section)
 
         return syntax_errors, semantic_errors
 
+    @staticmethod
+    def _collect_section_errors(text: str, errors: List[str]):
+        """
+        Collect error lines from the body of a parser output section.
+
+        Args:
+            text: Section text between two markers
+            errors: List to append error messages to
+        """
+        for line in text.splitlines():
+            if line.strip():
+                if not line.startswith(("Total", "✗")):
+                    errors.append(line.strip())
+
     def format_error_summary(self) -> str:
         """
         Create a formatted summary of all errors.
@@ -144,48 +186,43 @@ class ErrorHandler:
         Returns:
             Formatted error summary string
         """
-        lines = []
+        lexical_count = len(self.lexical_errors)
+        syntax_count = len(self.syntax_errors)
+        semantic_count = len(self.semantic_errors)
+        total_errors = lexical_count + syntax_count + semantic_count
 
-        total_errors = (
-            len(self.lexical_errors) +
-            len(self.syntax_errors) +
-            len(self.semantic_errors)
-        )
-
-        if total_errors == 0:
+        if not total_errors:
             return "✓ No errors detected - Analysis successful!"
 
-        lines.append("=" * 70)
+        lines = []
+        lines.append(_SEPARATOR)
         lines.append("  ERROR SUMMARY")
-        lines.append("=" * 70)
+        lines.append(_SEPARATOR)
         lines.append(f"Total Errors Found: {total_errors}")
         lines.append("")
 
         # Lexical errors
-        if self.lexical_errors:
-            lines.append(f"✗ Lexical Errors ({len(self.lexical_errors)}):")
-            lines.append("-" * 70)
-            for i, error in enumerate(self.lexical_errors, 1):
-                lines.append(f"  {i}. {error}")
+        if lexical_count:
+            lines.append(f"✗ Lexical Errors ({lexical_count}):")
+            lines.append(_SUBSEPARATOR)
+            lines.extend(f"  {i}. {error}" for i, error in enumerate(self.lexical_errors, 1))
             lines.append("")
 
         # Syntax errors
-        if self.syntax_errors:
-            lines.append(f"✗ Syntax Errors ({len(self.syntax_errors)}):")
-            lines.append("-" * 70)
-            for i, error in enumerate(self.syntax_errors, 1):
-                lines.append(f"  {i}. {error}")
+        if syntax_count:
+            lines.append(f"✗ Syntax Errors ({syntax_count}):")
+            lines.append(_SUBSEPARATOR)
+            lines.extend(f"  {i}. {error}" for i, error in enumerate(self.syntax_errors, 1))
             lines.append("")
 
         # Semantic errors
-        if self.semantic_errors:
-            lines.append(f"✗ Semantic Errors ({len(self.semantic_errors)}):")
-            lines.append("-" * 70)
-            for i, error in enumerate(self.semantic_errors, 1):
-                lines.append(f"  {i}. {error}")
+        if semantic_count:
+            lines.append(f"✗ Semantic Errors ({semantic_count}):")
+            lines.append(_SUBSEPARATOR)
+            lines.extend(f"  {i}. {error}" for i, error in enumerate(self.semantic_errors, 1))
             lines.append("")
 
-        lines.append("=" * 70)
+        lines.append(_SEPARATOR)
 
         return "\n".join(lines)
 
@@ -206,9 +243,19 @@ class ErrorHandler:
             'lexical': len(self.lexical_errors),
             'syntax': len(self.syntax_errors),
             'semantic': len(self.semantic_errors),
-            'total': len(self.lexical_errors) + len(self.syntax_errors) + len(self.semantic_errors)
+            'total': self.total_errors
         }
 
+    @property
+    def total_errors(self) -> int:
+        """
+        Get the total number of errors across all categories.
+
+        Returns:
+            Total error count
+        """
+        return len(self.lexical_errors) + len(self.syntax_errors) + len(self.semantic_errors)
+
     def has_errors(self) -> bool:
         """
         Check if any errors were detected.
@@ -216,7 +263,7 @@ class ErrorHandler:
         Returns:
             True if any errors exist, False otherwise
         """
-        return self.get_error_count()['total'] > 0
+        return bool(self.lexical_errors or self.syntax_errors or self.semantic_errors)
 
     def get_error_types(self) -> List[str]:
         """
@@ -245,14 +292,10 @@ class ErrorHandler:
         Returns:
             Formatted error string with icon
         """
-        icons = {
-            'lexical': '🔤',
-            'syntax': '📝',
-            'semantic': '🔍'
-        }
-
-        icon = icons.get(error_type, '❌')
-        return f"{icon} [{error_type.upper()}] {error_message}"
+        prefix = self._DISPLAY_PREFIXES.get(error_type)
+        if prefix is None:
+            return f"❌ [{error_type.upper()}] {error_message}"
+        return prefix + error_message
 
     def clear_errors(self):
         """Clear all stored errors."""
@@ -271,16 +314,8 @@ class ErrorHandler:
         Returns:
             Line number if found, -1 otherwise
         """
-        # Try to match patterns like "line 5", "at line 5", "Line: 5"
-        patterns = [
-            r'line\s+(\d+)',
-            r'at\s+line\s+(\d+)',
-            r'Line:\s*(\d+)',
-            r'\[Line\s+(\d+)\]',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, error_message, re.IGNORECASE)
+        for pattern in _LINE_NUMBER_RES:
+            match = pattern.search(error_message)
             if match:
                 return int(match.group(1))
 
@@ -298,10 +333,20 @@ class ErrorHandler:
         Returns:
             Code with the error line highlighted
         """
-        lines = code.split('\n')
-
-        if 1 <= line_number <= len(lines):
-            # Mark the error line
-            lines[line_number - 1] = f">>> {lines[line_number - 1]}  <<<< ERROR HERE"
-
-        return '\n'.join(lines)
+        if line_number < 1:
+            return code
+
+        # Find the start of the requested line without splitting the source
+        start = 0
+        for _ in range(line_number - 1):
+            newline = code.find('\n', start)
+            if newline == -1:
+                return code
+            start = newline + 1
+
+        end = code.find('\n', start)
+        if end == -1:
+            end = len(code)
+
+        # Mark the error line
+        return f"{code[:start]}>>> {code[start:end]}  <<<< ERROR HERE{code[end:]}"
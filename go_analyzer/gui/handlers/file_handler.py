@@ -6,7 +6,6 @@ analysis results to text files.
 """
 
 import os
-from pathlib import Path
 from tkinter import filedialog, messagebox
 from ..config import GO_FILE_TYPES, TEXT_FILE_TYPES, DEFAULT_GO_EXTENSION, DEFAULT_TEXT_EXTENSION
 
@@ -32,8 +31,20 @@ class FileHandler:
         # Track current file path
         self._current_file_path = None
 
-        # Get path to examples directory
-        self._examples_dir = self._get_examples_directory()
+        # Path to examples directory, resolved on first use
+        self._examples_dir_cache = None
+
+    @property
+    def _examples_dir(self):
+        """
+        Get the examples directory, looking it up only once.
+
+        Returns:
+            str: Path to examples directory, or current directory if not found
+        """
+        if self._examples_dir_cache is None:
+            self._examples_dir_cache = self._get_examples_directory()
+        return self._examples_dir_cache
 
     def _get_examples_directory(self):
         """
@@ -44,15 +55,15 @@ class FileHandler:
         """
         try:
             # Get the directory where this file is located
-            current_file = Path(__file__).resolve()
+            handlers_dir = os.path.dirname(os.path.abspath(__file__))
 
             # Navigate to gui/resources/examples/
-            gui_dir = current_file.parent.parent  # Go up to gui/
-            examples_dir = gui_dir / "resources" / "examples"
+            gui_dir = os.path.dirname(handlers_dir)  # Go up to gui/
+            examples_dir = os.path.join(gui_dir, "resources", "examples")
 
             # Check if directory exists
-            if examples_dir.exists() and examples_dir.is_dir():
-                return str(examples_dir)
+            if os.path.isdir(examples_dir):
+                return examples_dir
         except:
             pass
 
@@ -87,9 +98,13 @@ class FileHandler:
             if not file_path:
                 return False
 
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            # Read file content in one block and decode it in one step
+            with open(file_path, 'rb') as file:
+                content = file.read().decode('utf-8')
+
+            # Normalize line endings only when the file actually has them
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
 
             # Load content into editor
             self.code_editor.set_code(content)
@@ -162,8 +177,8 @@ class FileHandler:
             code = self.code_editor.get_code()
 
             # Write to file
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(code)
+            with open(file_path, 'wb') as file:
+                file.write(code.encode('utf-8'))
 
             # Update current file path
             self._current_file_path = file_path
@@ -215,8 +230,8 @@ class FileHandler:
             code = self.code_editor.get_code()
 
             # Write to file
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(code)
+            with open(file_path, 'wb') as file:
+                file.write(code.encode('utf-8'))
 
             # Update current file path
             self._current_file_path = file_path
@@ -265,12 +280,10 @@ class FileHandler:
             if not file_path:
                 return False
 
-            # Get results text
-            results_text = self.results_panel.get_text()
-
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(results_text)
+            # Write results text to file chunk by chunk
+            with open(file_path, 'wb') as file:
+                for chunk in self.results_panel.iter_text():
+                    file.write(chunk.encode('utf-8'))
 
             # Update status
             filename = os.path.basename(file_path)
@@ -5,6 +5,7 @@ Provides the primary application window with a two-panel layout
 for code editing and results display.
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from .components.code_editor import CodeEditor
@@ -109,21 +110,32 @@ class MainWindow:
 
     def _setup_shortcuts(self):
         """Set up keyboard shortcuts using config constants."""
-        # Ctrl+R - Run analysis
-        for shortcut in SHORTCUT_RUN_ANALYSIS:
-            self.root.bind(shortcut, lambda e: self.run_analysis())
+        shortcut_handlers = (
+            (SHORTCUT_RUN_ANALYSIS, self._on_run_analysis),    # Ctrl+R - Run analysis
+            (SHORTCUT_CLEAR_RESULTS, self._on_clear_results),  # Ctrl+L - Clear results
+            (SHORTCUT_LOAD_FILE, self._on_load_file),          # Ctrl+O - Load file
+            (SHORTCUT_SAVE_RESULTS, self._on_save_results),    # Ctrl+S - Save results
+        )
+
+        for shortcuts, handler in shortcut_handlers:
+            for shortcut in shortcuts:
+                self.root.bind(shortcut, handler)
 
-        # Ctrl+L - Clear results
-        for shortcut in SHORTCUT_CLEAR_RESULTS:
-            self.root.bind(shortcut, lambda e: self.clear_results())
+    def _on_run_analysis(self, event=None):
+        """Handle the run analysis shortcut."""
+        self.run_analysis()
 
-        # Ctrl+O - Load file
-        for shortcut in SHORTCUT_LOAD_FILE:
-            self.root.bind(shortcut, lambda e: self.load_file())
+    def _on_clear_results(self, event=None):
+        """Handle the clear results shortcut."""
+        self.clear_results()
 
-        # Ctrl+S - Save results
-        for shortcut in SHORTCUT_SAVE_RESULTS:
-            self.root.bind(shortcut, lambda e: self.save_results())
+    def _on_load_file(self, event=None):
+        """Handle the load file shortcut."""
+        self.load_file()
+
+    def _on_save_results(self, event=None):
+        """Handle the save results shortcut."""
+        self.save_results()
 
     def run_analysis(self):
         """Run analysis on the current code."""
@@ -146,9 +158,11 @@ class MainWindow:
     def on_closing(self):
         """Handle window close event."""
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
-            # Save state before closing
-            self.state.save_state()
-            self.root.destroy()
+            # Save state in the background so disk I/O doesn't hold up shutdown
+            threading.Thread(target=self.state.save_state).start()
+
+            # Destroy the window once this handler has returned
+            self.root.after_idle(self.root.destroy)
 
     def run(self):
         """Start the GUI application main loop."""
@@ -7,9 +7,55 @@ optional state persistence between sessions.
 
 import os
 import json
+import atexit
+import weakref
+from collections import deque
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Maximum number of analysis history entries kept
+HISTORY_MAX_ENTRIES = 100
+
+# Number of journal records after which the state is compacted into a snapshot
+JOURNAL_COMPACT_INTERVAL = 200
+
+# Size above which the reusable journal write buffer is released
+JOURNAL_BUFFER_SOFT_MAX = 128 * 1024
+
+
+# Default config directory, resolved on first use
+_DEFAULT_CONFIG_DIR = None
+
+# States with an open journal handle, closed at interpreter exit
+_OPEN_JOURNALS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_journals():
+    """Close the journal handles of all live AppState instances."""
+    for state in list(_OPEN_JOURNALS):
+        state.close()
+
+
+# Compact JSON encoding of state data, using orjson when it is installed
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        # Accept non-string dict keys, as the stdlib encoder does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    _loads = json.loads
+
 
 class AppState:
     """Manages application state and preferences."""
@@ -22,22 +68,40 @@ class AppState:
             config_dir (str, optional): Directory for storing config files.
                                        Defaults to ~/.go_analyzer
         """
+        global _DEFAULT_CONFIG_DIR
+
         # Set config directory
         if config_dir is None:
-            home_dir = os.path.expanduser("~")
-            self.config_dir = os.path.join(home_dir, ".go_analyzer")
+            if _DEFAULT_CONFIG_DIR is None:
+                home_dir = os.path.expanduser("~")
+                _DEFAULT_CONFIG_DIR = os.path.join(home_dir, ".go_analyzer")
+            self.config_dir = _DEFAULT_CONFIG_DIR
         else:
             self.config_dir = config_dir
 
         # Ensure config directory exists
         os.makedirs(self.config_dir, exist_ok=True)
 
-        # State file path
+        # State snapshot and change journal paths
         self.state_file = os.path.join(self.config_dir, "state.json")
+        self.journal_file = os.path.join(self.config_dir, "state.log")
+
+        # Open journal handle, reusable write buffer and records written
+        # since the last snapshot
+        self._log_fh = None
+        self._log_buf = bytearray()
+        self._journal_count = 0
+
+        # Sequence number of the last journaled change; the snapshot stores
+        # the number it covers so replay can skip records already in it
+        self._seq = 0
+
+        # Whether the in-memory state differs from the saved snapshot
+        self._dirty = False
 
         # Current state
         self._current_file = None
-        self._analysis_history = []
+        self._analysis_history = deque(maxlen=HISTORY_MAX_ENTRIES)
         self._preferences = {
             "theme": "dark",
             "font_size": 11,
@@ -45,6 +109,11 @@ class AppState:
             "show_line_numbers": False
         }
 
+        # Recent file lists keyed by limit and history statistics, dropped
+        # whenever the history changes
+        self._recent_files_cache = {}
+        self._stats_cache = None
+
         # Load saved state
         self._load_state()
 
@@ -56,6 +125,7 @@ class AppState:
             file_path (str or None): Path to the current file
         """
         self._current_file = file_path
+        self._append_journal({"op": "file", "path": file_path})
 
     def get_current_file(self) -> Optional[str]:
         """
@@ -81,11 +151,24 @@ class AppState:
             "error_count": len(result.get("errors", []))
         }
 
+        self._append_history(history_entry)
+        self._append_journal({"op": "hist", "entry": history_entry})
+
+    def _append_history(self, history_entry: Dict[str, Any]):
+        """
+        Append an entry to the in-memory history.
+
+        Args:
+            history_entry (dict): History entry to append
+        """
+        # The deque drops the oldest entry once HISTORY_MAX_ENTRIES is reached
         self._analysis_history.append(history_entry)
+        self._history_changed()
 
-        # Keep only the last 100 entries
-        if len(self._analysis_history) > 100:
-            self._analysis_history = self._analysis_history[-100:]
+    def _history_changed(self):
+        """Invalidate values derived from the analysis history."""
+        self._recent_files_cache.clear()
+        self._stats_cache = None
 
     def get_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -97,11 +180,13 @@ class AppState:
         Returns:
             list: List of history entries
         """
-        return self._analysis_history[-limit:]
+        return list(self._analysis_history)[-limit:]
 
     def clear_history(self):
         """Clear all analysis history."""
-        self._analysis_history = []
+        self._analysis_history = deque(maxlen=HISTORY_MAX_ENTRIES)
+        self._history_changed()
+        self._append_journal({"op": "clear_hist"})
 
     def set_preference(self, key: str, value: Any):
         """
@@ -112,6 +197,7 @@ class AppState:
             value: Preference value
         """
         self._preferences[key] = value
+        self._append_journal({"op": "pref", "key": key, "value": value})
 
     def get_preference(self, key: str, default=None) -> Any:
         """
@@ -137,21 +223,42 @@ class AppState:
 
     def save_state(self) -> bool:
         """
-        Save the current state to disk.
+        Save the current state to disk as a snapshot and clear the journal.
+
+        The snapshot is written to a temporary file and renamed over the
+        state file, so a crash mid-write never leaves a truncated file.
+        Nothing is written if the state has not changed since the last save.
 
         Returns:
             bool: True if save was successful, False otherwise
         """
+        if not self._dirty:
+            return True
+
         try:
             state_data = {
                 "current_file": self._current_file,
-                "analysis_history": self._analysis_history,
+                "analysis_history": list(self._analysis_history),
                 "preferences": self._preferences,
+                "seq": self._seq,
                 "last_saved": datetime.now().isoformat()
             }
 
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, indent=2)
+            temp_file = self.state_file + ".tmp"
+            data = _dumps(state_data)
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.state_file)
+
+            # The snapshot now includes every journaled change
+            if self._log_fh is not None:
+                self._log_fh.truncate(0)
+            else:
+                open(self.journal_file, 'wb').close()
+            self._journal_count = 0
+            self._dirty = False
 
             return True
 
@@ -159,38 +266,153 @@ class AppState:
             print(f"Error saving state: {e}")
             return False
 
-    def _load_state(self) -> bool:
+    def _append_journal(self, record: Dict[str, Any]):
         """
-        Load saved state from disk.
+        Append a single change record to the state journal.
 
-        Returns:
-            bool: True if load was successful, False otherwise
+        The state is compacted into a snapshot every
+        JOURNAL_COMPACT_INTERVAL records.
+
+        Args:
+            record (dict): Change record with an "op" key
         """
+        self._dirty = True
+        self._seq += 1
+        record["seq"] = self._seq
+
         try:
-            if not os.path.exists(self.state_file):
-                return False
+            if self._log_fh is None:
+                # Unbuffered append handle, so records need no separate flush
+                self._log_fh = open(self.journal_file, 'ab', buffering=0)
+                _OPEN_JOURNALS.add(self)
+
+            buf = self._log_buf
+            buf.clear()
+            buf += _dumps(record)
+            buf += b"\n"
+
+            # Unbuffered writes may be partial; finish the record
+            with memoryview(buf) as view:
+                written = 0
+                while written < len(view):
+                    written += self._log_fh.write(view[written:])
+            self._journal_count += 1
+
+            if len(buf) > JOURNAL_BUFFER_SOFT_MAX:
+                self._log_buf = bytearray()
 
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                state_data = json.load(f)
+        except Exception as e:
+            print(f"Error writing state journal: {e}")
+            return
 
-            # Restore state
-            self._current_file = state_data.get("current_file")
-            self._analysis_history = state_data.get("analysis_history", [])
+        if self._journal_count >= JOURNAL_COMPACT_INTERVAL:
+            self.save_state()
 
-            # Merge preferences (keep new defaults, override with saved values)
-            saved_prefs = state_data.get("preferences", {})
-            self._preferences.update(saved_prefs)
+    def close(self):
+        """Close the state journal file handle."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+            _OPEN_JOURNALS.discard(self)
 
-            return True
+    def _load_state(self) -> bool:
+        """
+        Load saved state from disk and replay the journal on top of it.
+
+        Journal records already covered by the snapshot (a crash between
+        writing the snapshot and truncating the journal) and malformed
+        records are skipped.
+
+        Returns:
+            bool: True if load was successful, False otherwise
+        """
+        try:
+            loaded = False
+
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'rb') as f:
+                    state_data = _loads(f.read())
+
+                # Restore state
+                self._current_file = state_data.get("current_file")
+                self._analysis_history = deque(
+                    state_data.get("analysis_history", []), maxlen=HISTORY_MAX_ENTRIES
+                )
+                self._history_changed()
+
+                # Merge preferences (keep new defaults, override with saved values)
+                saved_prefs = state_data.get("preferences", {})
+                self._preferences.update(saved_prefs)
+                self._seq = state_data.get("seq", 0)
+                loaded = True
+
+            if os.path.exists(self.journal_file):
+                with open(self.journal_file, 'rb+') as f:
+                    data = f.read()
+
+                    # Drop a torn last record so the next append starts on
+                    # a fresh line instead of being merged into it
+                    if data and not data.endswith(b"\n"):
+                        data = data[:data.rfind(b"\n") + 1]
+                        f.truncate(len(data))
+
+                    for line in data.splitlines():
+                        try:
+                            record = _loads(line)
+                            seq = record["seq"]
+                            if seq <= self._seq:
+                                continue
+                            self._replay_record(record)
+                        except (ValueError, KeyError, TypeError, AttributeError):
+                            # Skip a partially written or malformed record
+                            continue
+                        self._seq = seq
+                        self._journal_count += 1
+                        self._dirty = True
+                loaded = True
+
+            return loaded
 
         except Exception as e:
             print(f"Error loading state: {e}")
             return False
 
+    def _replay_record(self, record: Dict[str, Any]):
+        """
+        Apply a journal record to the in-memory state.
+
+        Args:
+            record (dict): Change record written by _append_journal
+
+        Raises:
+            KeyError, TypeError: If the record is malformed
+        """
+        op = record["op"]
+        if op == "file":
+            self._current_file = record["path"]
+        elif op == "hist":
+            entry = record["entry"]
+            if not isinstance(entry, dict):
+                raise TypeError("history entry must be an object")
+            self._append_history(entry)
+        elif op == "clear_hist":
+            self._analysis_history = deque(maxlen=HISTORY_MAX_ENTRIES)
+            self._history_changed()
+        elif op == "pref":
+            self._preferences[record["key"]] = record["value"]
+        elif op == "reset":
+            self._reset_state()
+
     def reset(self):
         """Reset state to defaults (does not delete saved state file)."""
+        self._reset_state()
+        self._append_journal({"op": "reset"})
+
+    def _reset_state(self):
+        """Reset the in-memory state to defaults."""
         self._current_file = None
-        self._analysis_history = []
+        self._analysis_history = deque(maxlen=HISTORY_MAX_ENTRIES)
+        self._history_changed()
         self._preferences = {
             "theme": "dark",
             "font_size": 11,
@@ -208,20 +430,16 @@ class AppState:
         Returns:
             list: List of file paths, most recent first
         """
-        # Extract unique file paths from history, maintaining order
-        seen = set()
-        recent_files = []
-
-        for entry in reversed(self._analysis_history):
-            file_path = entry.get("file_path")
-            if file_path and file_path not in seen:
-                recent_files.append(file_path)
-                seen.add(file_path)
+        recent_files = self._recent_files_cache.get(limit)
 
-            if len(recent_files) >= limit:
-                break
+        if recent_files is None:
+            # Extract unique file paths from history, most recent first;
+            # dict keys keep the first occurrence of each path
+            paths = [entry.get("file_path") for entry in reversed(self._analysis_history)]
+            recent_files = list(dict.fromkeys(path for path in paths if path))[:limit]
+            self._recent_files_cache[limit] = recent_files
 
-        return recent_files
+        return list(recent_files)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -230,23 +448,33 @@ class AppState:
         Returns:
             dict: Dictionary containing various statistics
         """
+        if self._stats_cache is not None:
+            return self._stats_cache.copy()
+
         if not self._analysis_history:
-            return {
+            stats = {
                 "total_analyses": 0,
                 "successful_analyses": 0,
                 "failed_analyses": 0,
                 "total_errors": 0
             }
+        else:
+            # Count successes and errors in a single pass
+            total = len(self._analysis_history)
+            successful = 0
+            total_errors = 0
+            for entry in self._analysis_history:
+                if entry.get("success", False):
+                    successful += 1
+                total_errors += entry.get("error_count", 0)
+
+            stats = {
+                "total_analyses": total,
+                "successful_analyses": successful,
+                "failed_analyses": total - successful,
+                "total_errors": total_errors,
+                "average_errors": total_errors / total if total > 0 else 0
+            }
 
-        total = len(self._analysis_history)
-        successful = sum(1 for entry in self._analysis_history if entry.get("success", False))
-        failed = total - successful
-        total_errors = sum(entry.get("error_count", 0) for entry in self._analysis_history)
-
-        return {
-            "total_analyses": total,
-            "successful_analyses": successful,
-            "failed_analyses": failed,
-            "total_errors": total_errors,
-            "average_errors": total_errors / total if total > 0 else 0
-        }
+        self._stats_cache = stats
+        return stats.copy()
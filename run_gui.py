@@ -15,12 +15,13 @@ import os
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from go_analyzer.gui import MainWindow
-
 
 def main():
     """Main entry point for the GUI application."""
     try:
+        # Imported here so the Tk widget stack loads only when the GUI starts
+        from go_analyzer.gui import MainWindow
+
         app = MainWindow()
         app.run()
     except KeyboardInterrupt:
@@ -0,0 +1,42 @@
+"""
+Regression tests for AppState journal recovery.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from go_analyzer.gui.state.app_state import AppState
+
+
+class TestAppStateJournal(unittest.TestCase):
+    """Tests for replaying the AppState change journal."""
+
+    def setUp(self):
+        self.config_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.config_dir, ignore_errors=True)
+
+    def test_torn_tail_then_append_then_reload(self):
+        state = AppState(self.config_dir)
+        state.set_preference("z", 1)
+        state.close()
+
+        # Simulate a crash in the middle of writing a record
+        with open(os.path.join(self.config_dir, "state.log"), "ab") as f:
+            f.write(b'{"op":"pref","key":"z","val')
+
+        state = AppState(self.config_dir)
+        self.assertEqual(state.get_preference("z"), 1)
+        state.set_preference("z", 2)
+        state.close()
+
+        state = AppState(self.config_dir)
+        self.assertEqual(state.get_preference("z"), 2)
+        state.close()
+
+
+if __name__ == "__main__":
+    unittest.main()